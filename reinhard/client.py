@@ -146,7 +146,10 @@ _OLD_DELETE_BUTTON = yuyo.components.SingleExecutor(
 def _build(client: tanjun.Client, config: config_.FullConfig) -> tanjun.Client:
     (
         client.set_hooks(tanjun.AnyHooks().set_on_parser_error(utility.on_parser_error).set_on_error(utility.on_error))
-        .add_prefix(config.prefixes)
+        # Tanjun returns the first prefix which matches, so these are registered
+        # longest first to ensure overlapping prefixes (e.g. "r" and "r.")
+        # always resolve to the longest match.
+        .add_prefix(sorted(config.prefixes, key=len, reverse=True))
         .set_type_dependency(config_.FullConfig, config)
         .set_type_dependency(config_.Tokens, config.tokens)
     )
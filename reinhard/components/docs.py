@@ -34,6 +34,7 @@ from __future__ import annotations
 __all__: list[str] = ["load_docs"]
 
 import abc
+import asyncio
 import datetime
 import hashlib
 import json
@@ -252,7 +253,9 @@ def make_autocomplete(index_type: type[DocIndex]) -> tanjun.abc.AutocompleteSig[
 def make_lifetimes(index_type: type[_DocIndexT], /) -> tanjun.schedules.AbstractSchedule:
     async def fetch(session: alluka.Injected[aiohttp.ClientSession]) -> _DocIndexT:
         data = await utility.fetch_resource(session, index_type.fetch_url())
-        return index_type.from_json(data)
+        # Building the index (markdown conversion and the lunr search index) is
+        # CPU bound so this is done in a thread to avoid blocking the event loop.
+        return await asyncio.to_thread(index_type.from_json, data)
 
     # Annotated can't be used here for interval cause forward annotations
     @tanjun.as_interval(datetime.timedelta(hours=6))
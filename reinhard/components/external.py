@@ -33,6 +33,7 @@ from __future__ import annotations
 
 __all__: list[str] = ["load_external"]
 
+import asyncio
 import datetime
 import enum
 import hashlib
@@ -41,6 +42,7 @@ import time
 import typing
 import urllib.parse
 from collections import abc as collections
+from collections import deque
 from typing import Annotated
 
 import aiohttp
@@ -82,7 +84,7 @@ class YoutubePaginator(collections.AsyncIterator[tuple[str, hikari.UndefinedType
     ) -> None:
         self._author = author
         self._session = session
-        self._buffer: list[dict[str, typing.Any]] = []
+        self._buffer: deque[dict[str, typing.Any]] = deque()
         self._next_page_token: str | None = ""
         self._parameters = parameters
 
@@ -90,7 +92,7 @@ class YoutubePaginator(collections.AsyncIterator[tuple[str, hikari.UndefinedType
         return self
 
     async def __anext__(self) -> yuyo.Page:
-        if not self._next_page_token and self._next_page_token is not None:
+        if not self._buffer and self._next_page_token is not None:
             retry = yuyo.Backoff(max_retries=5)
             error_manager = utility.AIOHTTPStatusHandler(self._author, retry, break_on=[404])
 
@@ -122,7 +124,7 @@ class YoutubePaginator(collections.AsyncIterator[tuple[str, hikari.UndefinedType
             raise StopAsyncIteration
 
         while self._buffer:
-            page = self._buffer.pop(0)
+            page = self._buffer.popleft()
             if response_type := YOUTUBE_TYPES.get(page["id"]["kind"].lower()):
                 return yuyo.Page(f"{response_type[1]}{page['id'][response_type[0]]}")
 
@@ -145,7 +147,7 @@ class SpotifyPaginator(collections.AsyncIterator[tuple[str, hikari.UndefinedType
         self._acquire_authorization = acquire_authorization
         self._author = author
         self._session = session
-        self._buffer: list[dict[str, typing.Any]] = []
+        self._buffer: deque[dict[str, typing.Any]] = deque()
         self._offset: int | None = 0
         self._parameters = parameters
 
@@ -190,7 +192,7 @@ class SpotifyPaginator(collections.AsyncIterator[tuple[str, hikari.UndefinedType
             self._offset = None
             raise StopAsyncIteration
 
-        return yuyo.Page(self._buffer.pop(0)["external_urls"]["spotify"])
+        return yuyo.Page(self._buffer.popleft()["external_urls"]["spotify"])
 
 
 class YtOrder(str, enum.Enum):
@@ -211,6 +213,30 @@ def yt_check(_: tanjun.abc.Context, tokens: alluka.Injected[config_.Tokens]) ->
     return tokens.google is not None
 
 
+async def _is_nsfw_channel(ctx: tanjun.abc.Context, /) -> bool:
+    # DM channels can't be marked as NSFW so there's no need to fetch them.
+    if ctx.guild_id is None:
+        return False
+
+    channel = None
+    if ctx.cache:
+        channel = ctx.cache.get_guild_channel(ctx.channel_id) or ctx.cache.get_thread(ctx.channel_id)
+
+    # TODO: handle retires
+    channel = channel or await ctx.rest.fetch_channel(ctx.channel_id)
+    if isinstance(channel, hikari.PermissibleGuildChannel):
+        return channel.is_nsfw
+
+    if isinstance(channel, hikari.GuildThreadChannel):
+        parent_channel = ctx.cache.get_guild_channel(channel.parent_id) if ctx.cache else None
+        parent_channel = parent_channel or await ctx.rest.fetch_channel(channel.parent_id)
+        assert isinstance(parent_channel, hikari.PermissibleGuildChannel)
+        return parent_channel.is_nsfw
+
+    _LOGGER.warning("Unexpected channel type in youtube of %r", type(channel))
+    return False
+
+
 # TODO: should different resource types be split between different sub commands?
 @doc_parse.with_annotated_args(follow_wrapped=True)
 @tanjun.with_check(yt_check, follow_wrapped=True)
@@ -254,25 +280,7 @@ async def youtube(
     """
     assert tokens.google is not None
     if safe_search is not False:
-        channel = None
-        if ctx.cache:
-            channel = ctx.cache.get_guild_channel(ctx.channel_id) or ctx.cache.get_thread(ctx.channel_id)
-
-        # TODO: handle retires
-        channel = channel or await ctx.rest.fetch_channel(ctx.channel_id)
-        if isinstance(channel, hikari.PermissibleGuildChannel):
-            channel_is_nsfw = channel.is_nsfw
-
-        elif isinstance(channel, hikari.GuildThreadChannel):
-            parent_channel = ctx.cache.get_guild_channel(channel.id) if ctx.cache else None
-            parent_channel = parent_channel or await ctx.rest.fetch_channel(channel.parent_id)
-            assert isinstance(parent_channel, hikari.PermissibleGuildChannel)
-            channel_is_nsfw = parent_channel.is_nsfw
-
-        else:
-            _LOGGER.warning("Unexpected channel type in youtube of %r", type(channel))
-            channel_is_nsfw = False
-
+        channel_is_nsfw = await _is_nsfw_channel(ctx)
         if safe_search is None:
             safe_search = not channel_is_nsfw
 
@@ -513,21 +521,32 @@ async def ytdl_command(
     await ctx.respond(content=file_path)
 
 
-async def _fetch_hashes(session: alluka.Injected[aiohttp.ClientSession]) -> set[str]:
-    # Original list.
-    response = await session.get("https://cdn.discordapp.com/bad-domains/hashes.json")
+async def _fetch_hash_list(session: aiohttp.ClientSession, url: str, /) -> list[str]:
+    response = await session.get(url)
     response.raise_for_status()
-    # Used by the client, longer list.
-    other_response = await session.get("https://cdn.discordapp.com/bad-domains/updated_hashes.json")
-    other_response.raise_for_status()
-    hashes = set(await response.json())
-    hashes.update(await other_response.json())
+    return await response.json()
+
+
+async def _fetch_hashes(session: alluka.Injected[aiohttp.ClientSession]) -> set[str]:
+    # These are independent so they're fetched concurrently.
+    original, updated = await asyncio.gather(
+        # Original list.
+        _fetch_hash_list(session, "https://cdn.discordapp.com/bad-domains/hashes.json"),
+        # Used by the client, longer list.
+        _fetch_hash_list(session, "https://cdn.discordapp.com/bad-domains/updated_hashes.json"),
+    )
+    hashes = set(original)
+    hashes.update(updated)
     return hashes
 
 
 domain_hashes = tanjun.cached_inject(_fetch_hashes, expire_after=datetime.timedelta(hours=12))
 
 
+def _hash_domain(domain: str, /) -> str:
+    return hashlib.sha256(domain.encode("utf-8")).hexdigest()
+
+
 @doc_parse.with_annotated_args(follow_wrapped=True)
 @tanjun.as_message_command("check_domain", "check domain")
 @doc_parse.as_slash_command()
@@ -551,13 +570,8 @@ async def check_domain(
         domain = url.path.split("/", 1)[0]
 
     base_domain = ".".join(domain.rsplit(".", 2)[1:])
-    domain_hash = hashlib.sha256(domain.encode("utf-8")).hexdigest()
-    if base_domain != domain:
-        base_domain_hash = hashlib.sha256(base_domain.encode("utf-8")).hexdigest()
-    else:
-        base_domain_hash = b"@"  # This will always return False as @ isn't a valid hex char
-
-    if domain_hash in bad_domains or base_domain_hash in bad_domains:
+    # The base domain is only hashed if the full domain isn't already a match.
+    if _hash_domain(domain) in bad_domains or (base_domain != domain and _hash_domain(base_domain) in bad_domains):
         await ctx.respond(
             content="\N{LARGE RED SQUARE} Domain is on the bad domains list.", component=buttons.delete_row(ctx)
         )
@@ -226,11 +226,7 @@ ban_group = (
 def get_top_role(
     role_ids: collections.Sequence[hikari.Snowflake], roles: collections.Mapping[hikari.Snowflake, hikari.Role]
 ) -> hikari.Role | None:
-    try:
-        next(iter(sorted(((role.position, role) for role in map(roles.get, role_ids) if role), reverse=True)))[1]
-
-    except StopIteration:
-        return None
+    return max(filter(None, map(roles.get, role_ids)), key=lambda role: role.position, default=None)
 
 
 @dataclasses.dataclass(slots=True)
@@ -31,7 +31,7 @@
 """Commands used to find the references for a type in Hikari and Tanjun."""
 from __future__ import annotations
 
-__slots__: list[str] = ["load_reference"]
+__all__: list[str] = ["load_reference"]
 
 import dataclasses
 import json
@@ -102,9 +102,15 @@ async def member(ctx: tanjun.abc.Context, member: Member | None = None) -> None:
     if member is None:
         member = ctx.member
 
-    # TODO: might want to try cache first at one point even if it cursifies the whole thing.
-    guild = await ctx.rest.fetch_guild(guild=ctx.guild_id)
-    roles = {role.id: role for role in map(guild.roles.get, member.role_ids) if role}
+    guild = ctx.get_guild() or await ctx.fetch_guild()
+    assert guild is not None
+    if isinstance(guild, hikari.RESTGuild):
+        guild_roles = guild.roles
+
+    else:
+        guild_roles = guild.get_roles() or {r.id: r for r in await guild.fetch_roles()}
+
+    roles = {role.id: role for role in map(guild_roles.get, member.role_ids) if role}
     ordered_roles = sorted(((role.position, role) for role in roles.values()), reverse=True)
 
     roles_repr = "\n".join(map("{0[1].name}: {0[1].id}".format, ordered_roles))  # noqa: FS002
@@ -44,6 +44,7 @@ __all__: list[str] = [
 
 import datetime
 import enum
+import functools
 import itertools
 import random
 import typing
@@ -72,11 +73,14 @@ def page_iterator(
     timestamp: datetime.datetime | None = None,
     cast_embed: collections.Callable[[hikari.Embed], hikari.Embed] | None = None,
 ) -> collections.Iterator[yuyo.Page]:
+    if color is None:
+        color = constants.embed_colour()
+
     iterator = (
         (
             hikari.Embed(
                 description=description_cast(description),
-                color=constants.embed_colour() if color is None else color,
+                color=color,
                 title=title,
                 url=url,
                 timestamp=timestamp,
@@ -90,16 +94,8 @@ def page_iterator(
     return map(yuyo.Page, iterator)
 
 
-def chunk(iterator: collections.Iterator[_ValueT], max_value: int, /) -> collections.Iterator[list[_ValueT]]:
-    chunk: list[_ValueT] = []
-    for entry in iterator:
-        chunk.append(entry)
-        if len(chunk) == max_value:
-            yield chunk
-            chunk = []
-
-    if chunk:
-        yield chunk
+def chunk(iterator: collections.Iterator[_ValueT], max_value: int, /) -> collections.Iterator[tuple[_ValueT, ...]]:
+    return itertools.batched(iterator, max_value)
 
 
 def prettify_date(date: datetime.datetime, /) -> str:
@@ -136,13 +132,19 @@ def raise_error(
     return raise_command_error_
 
 
+@functools.cache
+def _sorted_flag_members(flag_type: type[enum.IntFlag], /) -> tuple[tuple[str, enum.IntFlag], ...]:
+    return tuple(
+        sorted(
+            (name, flag)
+            for name, flag in flag_type.__members__.items()
+            if flag != 0  # pyright: ignore[reportUnnecessaryComparison]
+        )
+    )
+
+
 def basic_name_grid(flags: enum.IntFlag, /) -> str:  # TODO: actually deal with max len lol
-    names = [
-        name
-        for name, flag in type(flags).__members__.items()
-        if flag != 0 and (flag & flags) == flag  # pyright: ignore[reportUnnecessaryComparison]
-    ]
-    names.sort()
+    names = [name for name, flag in _sorted_flag_members(type(flags)) if (flag & flags) == flag]
     if not names:
         return ""
 
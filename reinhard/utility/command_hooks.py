@@ -32,14 +32,35 @@ from __future__ import annotations
 
 __all__ = ["on_error", "on_parser_error"]
 
+import re
+from typing import Annotated
+
+import alluka
 import hikari
 import tanjun
 from tanchan.components import buttons
 
+from .. import config as config_
 from . import constants
 
 
-async def on_error(ctx: tanjun.abc.Context, exception: BaseException) -> None:
+def _build_secret_pattern(config: alluka.Injected[config_.FullConfig]) -> re.Pattern[str]:
+    secrets = (
+        config.tokens.bot,
+        config.tokens.google,
+        config.tokens.spotify_secret,
+        config.database.password,
+        config.ptf.password if config.ptf else None,
+    )
+    # Longest first so a secret which contains another is redacted whole.
+    return re.compile("|".join(map(re.escape, sorted(set(filter(None, secrets)), key=len, reverse=True))))
+
+
+async def on_error(
+    ctx: tanjun.abc.Context,
+    exception: BaseException,
+    secret_pattern: Annotated[re.Pattern[str], tanjun.cached_inject(_build_secret_pattern)],
+) -> None:
     """Handle an unexpected error during command execution.
 
     This is the default error handler for all commands.
@@ -50,12 +71,15 @@ async def on_error(ctx: tanjun.abc.Context, exception: BaseException) -> None:
         The context of the command.
     exception
         The exception that was raised.
+    secret_pattern
+        Pattern used to redact the bot's configured secrets from the error.
     """
     # TODO: better permission checks
+    description = secret_pattern.sub("REDACTED", str(exception))
     embed = hikari.Embed(
         title=f"An unexpected {type(exception).__name__} occurred",
         colour=constants.FAILED_COLOUR,
-        description=f"```python\n{str(exception)[:1950]}```",
+        description=f"```python\n{description[:1950]}```",
     )
     await ctx.respond(embed=embed, component=buttons.delete_row(ctx))
 
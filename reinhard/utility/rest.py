@@ -32,6 +32,7 @@ from __future__ import annotations
 
 __all__: list[str] = ["AIOHTTPStatusHandler", "ClientCredentialsOauth2", "fetch_resource"]
 
+import asyncio
 import datetime
 import logging
 import time
@@ -127,48 +128,58 @@ async def fetch_resource(session: alluka.Injected[aiohttp.ClientSession], path:
 
 
 class ClientCredentialsOauth2:
-    __slots__ = ("_authorization", "_expire_at", "_path", "_prefix", "_token")
+    __slots__ = ("_authorization", "_expire_at", "_lock", "_path", "_prefix", "_token")
 
     def __init__(self, path: str, client_id: str, client_secret: str, *, prefix: str = "Bearer ") -> None:
         self._authorization = aiohttp.BasicAuth(client_id, client_secret)
-        self._expire_at = 0
+        self._expire_at = 0.0
+        self._lock = asyncio.Lock()
         self._path = path
         self._prefix = prefix
         self._token: str | None = None
 
     @property
     def _expired(self) -> bool:
-        return time.time() >= self._expire_at
+        return time.monotonic() >= self._expire_at
 
     async def acquire_token(self, session: aiohttp.ClientSession) -> str:
         if self._token and not self._expired:
             return self._token
 
-        response = await session.post(self._path, data={"grant_type": "client_credentials"}, auth=self._authorization)
+        async with self._lock:
+            # Another task may have refreshed the token while this was waiting.
+            if self._token and not self._expired:
+                return self._token
 
-        if 200 <= response.status < 300:
-            try:
-                data = await response.json()
-                expire = round(time.time()) + data["expires_in"] - 120
-                token = data["access_token"]
+            response = await session.post(
+                self._path, data={"grant_type": "client_credentials"}, auth=self._authorization
+            )
 
-            except (aiohttp.ContentTypeError, aiohttp.ClientPayloadError, ValueError, KeyError, TypeError) as exc:
-                _LOGGER.exception(
-                    "Couldn't decode or handle client credentials response received from %s: %r",
-                    self._path,
-                    await response.text(),
-                    exc_info=exc,
-                )
+            if 200 <= response.status < 300:
+                try:
+                    data = await response.json()
+                    expire = time.monotonic() + data["expires_in"] - 120
+                    token = data["access_token"]
+
+                except (aiohttp.ContentTypeError, aiohttp.ClientPayloadError, ValueError, KeyError, TypeError) as exc:
+                    _LOGGER.exception(
+                        "Couldn't decode or handle client credentials response received from %s: %r",
+                        self._path,
+                        await response.text(),
+                        exc_info=exc,
+                    )
+
+                else:
+                    self._expire_at = expire
+                    self._token = f"{self._prefix} {token}"
+                    return self._token
 
             else:
-                self._expire_at = expire
-                self._token = f"{self._prefix} {token}"
-                return self._token
-
-        else:
-            _LOGGER.warning(
-                "Received %r from %s while trying to authenticate as client credentials", response.status, self._path
-            )
+                _LOGGER.warning(
+                    "Received %r from %s while trying to authenticate as client credentials",
+                    response.status,
+                    self._path,
+                )
 
-        # TODO: replace delete_after with public delete button.
-        raise tanjun.CommandError("Couldn't authenticate", delete_after=datetime.timedelta(minutes=1))
+            # TODO: replace delete_after with public delete button.
+            raise tanjun.CommandError("Couldn't authenticate", delete_after=datetime.timedelta(minutes=1))
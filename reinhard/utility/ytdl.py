@@ -46,11 +46,13 @@ if typing.TYPE_CHECKING:
 
 _CLIENT_ATTRIBUTE = "REINHARD_YTDL_CLIENT"
 _OUT_DIR = str(pathlib.Path("videos/%(title)s-%(id)s.%(ext)s").absolute())
+# This has to be module level to be shared between calls, as each thread
+# then sees its own attributes and reuses the client it created.
+_THREAD_LOCAL = threading.local()
 
 
 def _download(url: str, /) -> tuple[pathlib.Path, dict[str, typing.Any]]:
-    thread_local = threading.local()
-    client = thread_local.__dict__.get(_CLIENT_ATTRIBUTE)
+    client = _THREAD_LOCAL.__dict__.get(_CLIENT_ATTRIBUTE)
 
     if not client or not isinstance(client, youtube_dl.YoutubeDL):
         client = youtube_dl.YoutubeDL(
@@ -63,7 +65,7 @@ def _download(url: str, /) -> tuple[pathlib.Path, dict[str, typing.Any]]:
                 "quiet": True,
             }
         )
-        thread_local.__dict__[_CLIENT_ATTRIBUTE] = client
+        _THREAD_LOCAL.__dict__[_CLIENT_ATTRIBUTE] = client
 
     data: typing.Any = client.extract_info(url)  # pyright: ignore[reportUnknownMemberType]
     path = pathlib.Path(
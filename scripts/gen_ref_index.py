@@ -75,9 +75,10 @@ def _add_search_entry(index: dict[str, typing.Any], path: str) -> None:
         else:
             index[char] = index = {}
 
+    # Callers only add paths the first time they're seen so there's no need
+    # to scan the existing links for duplicates here.
     if links := index.get(_END_KEY):
-        if path not in links:
-            links.append(path)
+        links.append(path)
 
     else:
         index[_END_KEY] = [path]
@@ -158,7 +159,8 @@ class ReferenceIndex:
         self._is_tracking_builtins = track_builtins
         self._indexed_modules: dict[str, types.ModuleType] = {}
         self._module_imports: dict[str, dict[str, str]] = {}
-        self._object_paths_to_uses: dict[str, list[str]] = {}
+        # Dicts are used as insertion-ordered sets here to keep de-duplication O(1).
+        self._object_paths_to_uses: dict[str, dict[str, None]] = {}
         self._object_search_tree: dict[str, typing.Any] = {}
         self._top_level_modules: set[str] = set()
         self._version = version
@@ -167,7 +169,7 @@ class ReferenceIndex:
         data = {
             "aliases": self._aliases,
             "alias_search_tree": self._alias_search_tree,
-            "object_paths_to_uses": self._object_paths_to_uses,
+            "object_paths_to_uses": {path: list(uses) for path, uses in self._object_paths_to_uses.items()},
             "object_search_tree": self._object_search_tree,
             "version": self._version,
         }
@@ -194,12 +196,11 @@ class ReferenceIndex:
         return False
 
     def _add_use(self, path: str, use: str) -> None:
-        if uses := self._object_paths_to_uses.get(path):
-            if use not in uses:
-                uses.append(use)
+        if (uses := self._object_paths_to_uses.get(path)) is not None:
+            uses[use] = None
 
         else:
-            self._object_paths_to_uses[path] = [use]
+            self._object_paths_to_uses[path] = {use: None}
             _add_search_entry(self._object_search_tree, path)
 
     def _get_or_parse_module_imports(self, module_name: str) -> dict[str, str]:
@@ -329,17 +330,18 @@ class ReferenceIndex:
             return
 
         if "." in annotation:
-            for name, import_path in module_imports.items():
-                without_key = annotation.removeprefix(name)
-                if without_key[0] == ".":
-                    self._add_use(self._try_find_path_source(import_path + without_key), path)
+            # Rather than scanning every import, look up each dotted prefix of the
+            # annotation directly (longest first so "import a.b" beats "import a").
+            end = len(annotation)
+            while (end := annotation.rfind(".", 0, end)) > 0:
+                if (import_path := module_imports.get(annotation[:end])) is not None:
+                    self._add_use(self._try_find_path_source(import_path + annotation[end:]), path)
                     return
 
             # If we hit this statement then this indicates that the annotation
             # refers to a 3rd party type and that we aren't tracking 3rd party
             # types so this can be safely ignored.
-            else:
-                _LOGGER.debug("Ignoring %r annotation from out-of-scope library at %r", annotation, path)
+            _LOGGER.debug("Ignoring %r annotation from out-of-scope library at %r", annotation, path)
 
         else:
             # If we got this far then it is either located in the current
@@ -446,7 +448,9 @@ class ReferenceIndex:
         children_only: bool,
         recursive: bool,
     ) -> Self:
-        for _, sub_module in filter(_is_public_key, inspect.getmembers(module)):
+        # A module's attributes are just its __dict__, so this avoids the
+        # dir() + getattr() + sort overhead of inspect.getmembers.
+        for _, sub_module in filter(_is_public_key, tuple(vars(module).items())):
             if isinstance(sub_module, types.ModuleType) and sub_module.__name__ not in found_modules:
                 if children_only and not sub_module.__name__.startswith(start_point):
                     continue
@@ -526,7 +530,7 @@ class ReferenceIndex:
             The module to scan for type references.
         """
         _LOGGER.info("Scanning %s", module.__name__)
-        module_members = dict[str, typing.Any](filter(_is_public_key, inspect.getmembers(module)))
+        module_members = dict[str, typing.Any](filter(_is_public_key, vars(module).items()))
         for name, obj in module_members.items():
             if isinstance(obj, (types.FunctionType, types.MethodType, type, classmethod)):
                 self._add_alias(f"{module.__name__}.{name}", f"{obj.__module__}.{obj.__qualname__}")